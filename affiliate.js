@@ -6,6 +6,15 @@
 (function() {
     'use strict';
 
+    // Per-element diagnostics only hit the console when config.js sets
+    // debug: true, so routine retries don't pay for console I/O.
+    function debugWarn() {
+        const config = window.AFFILIATE_CONFIG;
+        if (config && config.debug) {
+            console.warn.apply(console, arguments);
+        }
+    }
+
     // Wait for DOM to be fully loaded
     if (document.readyState === 'loading') {
         document.addEventListener('DOMContentLoaded', initAffiliateLinks);
@@ -22,25 +31,42 @@
 
         const config = window.AFFILIATE_CONFIG;
 
+        // Precompute the parameters to add once, instead of rebuilding them
+        // for each of the ~100 links on the page. This also applies the
+        // optional additionalParams from config.js.
+        const linkParams = [['tag', config.affiliateId]];
+        for (const key in (config.additionalParams || {})) {
+            linkParams.push([key, config.additionalParams[key]]);
+        }
+
         // Find all Amazon links
         const amazonLinks = document.querySelectorAll('a[href*="amazon"]');
 
+        // Memoize rewritten URLs so duplicate hrefs (same product linked
+        // more than once) skip the URL parse/serialize round-trip.
+        const rewrittenCache = new Map();
+
         // Process each link
         amazonLinks.forEach(link => {
             try {
-                const url = new URL(link.href);
-
-                // Only process Amazon links
-                if (!url.hostname.includes('amazon')) {
-                    return;
+                let rewritten = rewrittenCache.get(link.href);
+                if (rewritten === undefined) {
+                    const url = new URL(link.href);
+
+                    // Only process Amazon links
+                    if (!url.hostname.includes('amazon')) {
+                        return;
+                    }
+
+                    // Add the affiliate tag (and any extra configured params)
+                    linkParams.forEach(([key, value]) => url.searchParams.set(key, value));
+                    rewritten = url.toString();
+                    rewrittenCache.set(link.href, rewritten);
                 }
 
-                // Add the affiliate tag parameter
-                url.searchParams.set('tag', config.affiliateId);
-
                 // Update the link
-                link.href = url.toString();
-                
+                link.href = rewritten;
+
                 // Open in new tab
                 link.target = '_blank';
                 link.rel = 'noopener noreferrer';
@@ -65,7 +91,7 @@
             // Add error handler for failed image loads
             img.addEventListener('error', function() {
                 const retryCount = parseInt(this.getAttribute('data-retry-count') || '0');
-                console.warn('Failed to load image:', this.src, '(attempt ' + (retryCount + 1) + ')');
+                debugWarn('Failed to load image:', this.src, '(attempt ' + (retryCount + 1) + ')');
                 
                 if (retryCount < maxRetries) {
                     // Increment retry count
@@ -102,14 +128,17 @@
         
         if (!backToTopButton) return;
 
-        // Show/hide button based on scroll position
+        // Show/hide button based on scroll position. The listener is passive
+        // (never blocks scrolling) and only touches the DOM when the
+        // visibility state actually flips, not on every scroll event.
+        let buttonVisible = false;
         window.addEventListener('scroll', function() {
-            if (window.pageYOffset > SCROLL_THRESHOLD) {
-                backToTopButton.classList.add('visible');
-            } else {
-                backToTopButton.classList.remove('visible');
+            const shouldShow = window.pageYOffset > SCROLL_THRESHOLD;
+            if (shouldShow !== buttonVisible) {
+                buttonVisible = shouldShow;
+                backToTopButton.classList.toggle('visible', shouldShow);
             }
-        });
+        }, { passive: true });
 
         // Scroll to top when clicked
         backToTopButton.addEventListener('click', function() {
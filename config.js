@@ -15,7 +15,11 @@ const AFFILIATE_CONFIG = {
     // These will be appended to the URL
     additionalParams: {
         // Example: 'ref': 'as_li_ss_tl'
-    }
+    },
+
+    // Optional: Set to true to log per-link/per-image diagnostics to the
+    // browser console. Real errors are always logged.
+    debug: false
 };
 
 // Make config available globally
@@ -26,10 +26,9 @@
 
     if (darkModeToggle) {
         darkModeToggle.addEventListener('click', function () {
-            var isDark = document.body.classList.toggle('dark-mode');
+            var isDark = !document.body.classList.contains('dark-mode');
+            applyDarkMode(isDark);
             localStorage.setItem(DARK_MODE_KEY, isDark);
-            darkModeToggle.textContent = isDark ? '☀️' : '🌙';
-            darkModeToggle.title = isDark ? 'Switch to light mode' : 'Switch to dark mode';
         });
     }
 
@@ -40,24 +39,47 @@
 
     if (!searchInput) return;
 
+    // Built lazily on the first keystroke: each entry holds a card's
+    // lowercased searchable text and its category, so subsequent
+    // keystrokes never re-read or re-lowercase DOM text.
+    var searchIndex = null;
+    var categories = null;
+
+    function buildSearchIndex() {
+        categories = document.querySelectorAll('.category');
+        searchIndex = [];
+        document.querySelectorAll('.product-card').forEach(function (card) {
+            var title = (card.querySelector('.product-content h4') || {}).textContent || '';
+            var desc = (card.querySelector('.product-content > p') || {}).textContent || '';
+            searchIndex.push({
+                card: card,
+                text: (title + ' ' + desc).toLowerCase(),
+                category: card.closest('.category')
+            });
+        });
+    }
+
     searchInput.addEventListener('input', function () {
         var query = this.value.trim().toLowerCase();
-        var cards = document.querySelectorAll('.product-card');
-        var categories = document.querySelectorAll('.category');
+        if (!searchIndex) buildSearchIndex();
         var visible = 0;
+        var visiblePerCategory = new Map();
 
-        cards.forEach(function (card) {
-            var title = (card.querySelector('.product-content h4') || {}).textContent || '';
-            var desc = (card.querySelector('.product-content > p') || {}).textContent || '';
-            var match = !query || title.toLowerCase().includes(query) || desc.toLowerCase().includes(query);
-            card.classList.toggle('hidden', !match);
-            if (match) visible++;
+        searchIndex.forEach(function (entry) {
+            var match = !query || entry.text.includes(query);
+            entry.card.classList.toggle('hidden', !match);
+            if (match) {
+                visible++;
+                if (entry.category) {
+                    visiblePerCategory.set(entry.category, (visiblePerCategory.get(entry.category) || 0) + 1);
+                }
+            }
         });
 
-        // Hide categories that have no visible products
+        // Hide categories that have no visible products (counted above,
+        // so no re-query of the DOM per category)
         categories.forEach(function (cat) {
-            var visibleCards = cat.querySelectorAll('.product-card:not(.hidden)');
-            cat.classList.toggle('hidden', visibleCards.length === 0);
+            cat.classList.toggle('hidden', !visiblePerCategory.get(cat));
         });
 
         // Show result count when searching